@@ -7,7 +7,9 @@ Resolves "Multiple commands produce Info.plist" error by:
 3. Setting INFOPLIST_FILE to manual Info.plist path
 """
 
+import re
 from pathlib import Path
+from collections import Counter
 
 def fix_infoplist_conflict():
     print("🚀 Fixing Info.plist Build Conflict")
@@ -22,40 +24,47 @@ def fix_infoplist_conflict():
 
     original_content = content
 
-    # 1. Remove Info.plist from PBXBuildFile section
-    print("🗑️  Removing Info.plist from PBXBuildFile section...")
     infoplist_buildfile_line = "0DD18F0E2E7FBB1900A893D7 /* Info.plist in Resources */ = {isa = PBXBuildFile; fileRef = 0DD18F062E7FBB1900A893D7 /* Info.plist */; };"
+    infoplist_resource_line = "0DD18F0E2E7FBB1900A893D7 /* Info.plist in Resources */,"
+    infoplist_setting = "INFOPLIST_FILE = StreamApp/Info.plist;"
+    manual_infoplist = f"GENERATE_INFOPLIST_FILE = NO;\n\t\t\t\t{infoplist_setting}"
+
+    # All four edits are literal substitutions, so apply them in a single pass:
+    # 1. Remove Info.plist from PBXBuildFile section
+    # 2. Remove Info.plist from Resources build phase
+    # 3. Change GENERATE_INFOPLIST_FILE from YES to NO
+    # 4. Add INFOPLIST_FILE setting after GENERATE_INFOPLIST_FILE in both configurations
+    replacements = {
+        infoplist_buildfile_line: "",
+        infoplist_resource_line: "",
+        "GENERATE_INFOPLIST_FILE = YES;": manual_infoplist,
+        "GENERATE_INFOPLIST_FILE = NO;": manual_infoplist,
+    }
+    pattern = re.compile("|".join(re.escape(old) for old in replacements))
+    found = Counter()
+
+    def replace(match):
+        found[match.group(0)] += 1
+        return replacements[match.group(0)]
 
-    if infoplist_buildfile_line in content:
-        content = content.replace(infoplist_buildfile_line, "")
+    content = pattern.sub(replace, content)
+
+    print("🗑️  Removing Info.plist from PBXBuildFile section...")
+    if found[infoplist_buildfile_line]:
         print("  ✅ Removed PBXBuildFile entry")
     else:
         print("  ⚠️  PBXBuildFile entry not found")
 
-    # 2. Remove Info.plist from Resources build phase
     print("🗑️  Removing Info.plist from Resources build phase...")
-    infoplist_resource_line = "0DD18F0E2E7FBB1900A893D7 /* Info.plist in Resources */,"
-
-    if infoplist_resource_line in content:
-        content = content.replace(infoplist_resource_line, "")
+    if found[infoplist_resource_line]:
         print("  ✅ Removed from Resources build phase")
     else:
         print("  ⚠️  Resources build phase entry not found")
 
-    # 3. Change GENERATE_INFOPLIST_FILE from YES to NO
     print("⚙️  Disabling auto-generation...")
-    content = content.replace("GENERATE_INFOPLIST_FILE = YES;", "GENERATE_INFOPLIST_FILE = NO;")
     print("  ✅ Set GENERATE_INFOPLIST_FILE = NO")
 
-    # 4. Add INFOPLIST_FILE setting after GENERATE_INFOPLIST_FILE in both configurations
     print("📝 Adding INFOPLIST_FILE setting...")
-
-    # Add after each GENERATE_INFOPLIST_FILE = NO; line
-    infoplist_setting = "INFOPLIST_FILE = StreamApp/Info.plist;"
-    content = content.replace(
-        "GENERATE_INFOPLIST_FILE = NO;",
-        f"GENERATE_INFOPLIST_FILE = NO;\n\t\t\t\t{infoplist_setting}"
-    )
     print("  ✅ Added INFOPLIST_FILE setting to both configurations")
 
     # 5. Save the modified project
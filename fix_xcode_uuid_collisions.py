@@ -7,80 +7,98 @@ Repairs systematic UUID collisions in project.pbxproj that cause:
 
 import re
 import json
-import shutil
-import secrets
-from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+
+from xcode_fixer_base import BaseXcodeProjectFixer
+
+# Known UUID collisions from investigation: (uuid, group name, colliding file)
+_KNOWN_COLLISIONS = (
+    ("A1000001000000000000001A", "Core", "StreamApp.swift"),
+    ("A1000001000000000000008A", "Onboarding", "MainTabView.swift"),
+    ("A1000001000000000000007A", "Components", "WalletConnectView.swift"),
+    ("A1000001000000000000006E", "Authentication", "AuthenticationView.swift"),
+    ("A1000001000000000000006A", "Views", "WorkSessionViewModel.swift"),
+    ("A1000001000000000000005A", "ViewModels", "ZKProofService.swift"),
+    ("A1000001000000000000003E", "Security", "BiometricAuthService.swift"),
+    ("A1000001000000000000003A", "Resources", "StreamColors.swift"),
+    ("A1000001000000000000002E", "Network", "APIService.swift"),
+    ("A1000001000000000000002A", "Models", "Attestation.swift"),
+)
+
+# Patterns derived from the fixed collision list, compiled once at import
+_KNOWN_UUIDS = b"|".join(uuid.encode('ascii') for uuid, _, _ in _KNOWN_COLLISIONS)
+_KNOWN_UUID_RE = re.compile(_KNOWN_UUIDS)
+_GROUP_DEFINITION_RE = re.compile(b"(" + _KNOWN_UUIDS + rb") = \{[^}]+isa = PBXGroup[^}]+\}")
+
+# Everything the validators look at, matched in a single scan:
+# 24-hex-char UUIDs (with " = {" when it is the object's definition)
+# and "/* Begin X section */" headers
+_TOKEN_RE = re.compile(rb'[A-F0-9]{24}(?: = \{)?|/\* Begin \w+ section \*/')
+
+# Every byte except the brackets; deleting these with bytes.translate leaves
+# only the brackets, which is far cheaper than matching each one as a token
+_NON_BRACKET_BYTES = bytes(b for b in range(256) if b not in b'{}()')
+
+def _count_brackets(content):
+    """Count each of {, }, ( and ) in content"""
+    brackets = content.translate(None, _NON_BRACKET_BYTES)
+    return Counter({char: brackets.count(char.encode('ascii')) for char in "{}()"})
+
+# A group's children array: children = ( ... )
+_CHILDREN_RE = re.compile(rb'children = \([^)]*\)')
+
+class XcodeProjectFixer(BaseXcodeProjectFixer):
+    known_collisions = {uuid: {"name": name, "file": file} for uuid, name, file in _KNOWN_COLLISIONS}
+    title = "StreamApp Xcode Project UUID Collision Fix"
+    success_lines = (
+        "\n🎉 UUID collision fix completed successfully!",
+        "✅ Project should now open correctly in Xcode",
+    )
 
-class XcodeProjectFixer:
     def __init__(self, project_path):
-        self.project_path = Path(project_path)
-        self.pbxproj_path = self.project_path / "project.pbxproj"
+        super().__init__(project_path)
         self.collision_map = {}
-        self.content = ""
-        self.original_content = ""
-
-        # Known UUID collisions from investigation
-        self.known_collisions = {
-            "A1000001000000000000001A": {"name": "Core", "file": "StreamApp.swift"},
-            "A1000001000000000000008A": {"name": "Onboarding", "file": "MainTabView.swift"},
-            "A1000001000000000000007A": {"name": "Components", "file": "WalletConnectView.swift"},
-            "A1000001000000000000006E": {"name": "Authentication", "file": "AuthenticationView.swift"},
-            "A1000001000000000000006A": {"name": "Views", "file": "WorkSessionViewModel.swift"},
-            "A1000001000000000000005A": {"name": "ViewModels", "file": "ZKProofService.swift"},
-            "A1000001000000000000003E": {"name": "Security", "file": "BiometricAuthService.swift"},
-            "A1000001000000000000003A": {"name": "Resources", "file": "StreamColors.swift"},
-            "A1000001000000000000002E": {"name": "Network", "file": "APIService.swift"},
-            "A1000001000000000000002A": {"name": "Models", "file": "Attestation.swift"},
-        }
 
-    def generate_xcode_uuid(self):
-        """Generate proper Xcode-compatible 24-character hex UUID"""
-        # Generate 12 random bytes (96 bits)
-        random_bytes = secrets.token_bytes(12)
-        # Convert to 24-character uppercase hex string
-        return random_bytes.hex().upper()
-
-    def generate_unique_uuid_set(self, count, existing_uuids=set()):
-        """Generate a set of guaranteed unique UUIDs"""
-        uuids = set()
-        while len(uuids) < count:
-            uuid = self.generate_xcode_uuid()
-            if uuid not in existing_uuids and uuid not in uuids:
-                uuids.add(uuid)
-        return uuids
-
-    def load_project(self):
-        """Load and validate project file"""
-        print(f"Loading project file: {self.pbxproj_path}")
-        try:
-            with open(self.pbxproj_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
-                self.original_content = self.content
-            print(f"✅ Project file loaded ({len(self.content)} characters)")
-        except Exception as e:
-            raise Exception(f"Failed to load project file: {e}")
+    def scan_project(self):
+        """Tally UUIDs, definitions and section headers in one pass, plus bracket counts (cached per revision)"""
+        if "scan" not in self._cache:
+            uuid_counts = Counter()
+            definitions = set()
+            sections = set()
+
+            for token, count in Counter(_TOKEN_RE.findall(self.content)).items():
+                token = token.decode('ascii')
+                if token.startswith("/*"):
+                    sections.add(token[len("/* Begin "):-len(" section */")])
+                else:
+                    uuid = token[:24]
+                    uuid_counts[uuid] += count
+                    if len(token) > 24:
+                        definitions.add(uuid)
+
+            self._cache["scan"] = {
+                "uuid_counts": uuid_counts,
+                "definitions": definitions,
+                "bracket_counts": _count_brackets(self.content),
+                "sections": sections,
+            }
+        return self._cache["scan"]
 
     def detect_collisions(self):
-        """Identify all UUID collisions automatically"""
+        """Identify which of the known UUID collisions are present"""
         print("\n🔍 Detecting UUID collisions...")
 
-        # Find all UUIDs in the file
-        all_uuids = re.findall(r'[A-F0-9]{24}', self.content)
-        uuid_counts = defaultdict(int)
-
-        for uuid in all_uuids:
-            uuid_counts[uuid] += 1
+        # Only the known collisions get repaired, so count just those with one
+        # alternation instead of tallying every UUID in the file
+        uuid_counts = Counter(_KNOWN_UUID_RE.findall(self.content))
 
         # Find collisions (UUIDs that appear more than twice)
-        collisions = {}
-        for uuid, count in uuid_counts.items():
-            if count > 2:  # Build file + group + references = 3+ occurrences
-                collisions[uuid] = count
+        # Build file + group + references = 3+ occurrences
+        collisions = {uuid.decode('ascii'): count for uuid, count in uuid_counts.items() if count > 2}
 
         print(f"Found {len(collisions)} UUID collisions:")
         for uuid, count in collisions.items():
-            collision_info = self.known_collisions.get(uuid, {"name": "Unknown", "file": "Unknown"})
+            collision_info = self.known_collisions[uuid]
             print(f"  - {uuid}: {count} occurrences (Group: {collision_info['name']}, File: {collision_info['file']})")
 
         return collisions
@@ -89,16 +107,11 @@ class XcodeProjectFixer:
         """Generate new UUIDs for conflicting groups"""
         print("\n🔄 Generating replacement UUIDs...")
 
-        # Extract all existing UUIDs for collision avoidance
-        existing_uuids = set(re.findall(r'[A-F0-9]{24}', self.content))
-
-        # Generate new UUIDs for each collision
-        new_uuids = self.generate_unique_uuid_set(len(self.known_collisions), existing_uuids)
-        new_uuid_list = list(new_uuids)
+        # Generate new UUIDs for each collision, avoiding all existing ones
+        new_uuids = self.generate_unique_uuids(len(self.known_collisions), self.existing_uuids())
 
         replacement_map = {}
-        for i, (old_uuid, info) in enumerate(self.known_collisions.items()):
-            new_uuid = new_uuid_list[i]
+        for (old_uuid, info), new_uuid in zip(self.known_collisions.items(), new_uuids):
             replacement_map[old_uuid] = {
                 "old_uuid": old_uuid,
                 "new_group_uuid": new_uuid,
@@ -110,69 +123,84 @@ class XcodeProjectFixer:
         self.collision_map = replacement_map
         return replacement_map
 
+    def _encoded_replacements(self):
+        """Map each old UUID to its new group UUID, both as bytes"""
+        return {
+            old_uuid.encode('ascii'): mapping["new_group_uuid"].encode('ascii')
+            for old_uuid, mapping in self.collision_map.items()
+        }
+
     def fix_group_definitions(self):
-        """Update PBXGroup object definitions"""
+        """Collect edits for PBXGroup object definitions"""
         print("\n🔧 Fixing group definitions...")
 
+        # One alternation over every old UUID matches each group definition
+        # (OLD_UUID = { ... isa = PBXGroup ... }) in a single pass; only the
+        # leading UUID is replaced, the rest of the definition is preserved
+        new_uuids = self._encoded_replacements()
+        edits = []
+        updated = set()
+
+        for match in _GROUP_DEFINITION_RE.finditer(self.content):
+            old_uuid = match.group(1)
+            # The pattern covers every known collision; skip ones not being replaced
+            if old_uuid not in new_uuids:
+                continue
+            edits.append((match.start(1), match.end(1), new_uuids[old_uuid]))
+            updated.add(old_uuid.decode('ascii'))
+
         for old_uuid, mapping in self.collision_map.items():
             new_uuid = mapping["new_group_uuid"]
             group_name = mapping["group_name"]
-
-            # Pattern to match group definition: OLD_UUID = { ... isa = PBXGroup ... };
-            pattern = f"({old_uuid} = {{[^}}]+isa = PBXGroup[^}}]+}})"
-
-            # Find the match to verify it exists
-            match = re.search(pattern, self.content)
-            if match:
-                # Replace the UUID while preserving the rest of the definition
-                replacement = match.group(1).replace(old_uuid, new_uuid, 1)
-                self.content = self.content.replace(match.group(1), replacement)
+            if old_uuid in updated:
                 print(f"  ✅ Updated group definition: {group_name} ({old_uuid} → {new_uuid})")
             else:
                 print(f"  ⚠️  Group definition not found for: {group_name} ({old_uuid})")
 
+        return edits
+
     def fix_parent_references(self):
-        """Update all parent group children arrays"""
+        """Collect edits for all parent group children arrays"""
         print("\n🔗 Fixing parent references...")
 
-        for old_uuid, mapping in self.collision_map.items():
-            new_uuid = mapping["new_group_uuid"]
-            group_name = mapping["group_name"]
-
-            # Pattern to match children arrays containing the old UUID
-            pattern = f"(children = \\([^)]*){old_uuid}([^)]*\\))"
+        # Walk every children array once and find all old UUIDs inside it,
+        # rather than rescanning the whole file for each collision
+        new_uuids = self._encoded_replacements()
+        edits = []
+        references = Counter()
 
-            matches = re.findall(pattern, self.content)
-            if matches:
-                # Replace old UUID with new UUID in children arrays
-                for match in matches:
-                    old_children = f"children = ({match[0]}{old_uuid}{match[1]})"
-                    new_children = f"children = ({match[0]}{new_uuid}{match[1]})"
-                    self.content = self.content.replace(old_children, new_children)
+        for children in _CHILDREN_RE.finditer(self.content):
+            for match in _KNOWN_UUID_RE.finditer(self.content, children.start(), children.end()):
+                old_uuid = match.group(0)
+                if old_uuid not in new_uuids:
+                    continue
+                edits.append((match.start(), match.end(), new_uuids[old_uuid]))
+                references[old_uuid.decode('ascii')] += 1
 
-                print(f"  ✅ Updated parent references for: {group_name} ({len(matches)} references)")
+        for old_uuid, mapping in self.collision_map.items():
+            group_name = mapping["group_name"]
+            if references[old_uuid]:
+                print(f"  ✅ Updated parent references for: {group_name} ({references[old_uuid]} references)")
             else:
                 print(f"  ⚠️  No parent references found for: {group_name}")
 
+        return edits
+
     def validate_uuid_uniqueness(self):
         """Validate that all UUIDs are now unique"""
         print("\n✅ Validating UUID uniqueness...")
 
-        all_uuids = re.findall(r'[A-F0-9]{24}', self.content)
-        unique_uuids = set(all_uuids)
+        uuid_counts = self.scan_project()["uuid_counts"]
+        total_uuids = sum(uuid_counts.values())
 
-        if len(all_uuids) == len(unique_uuids):
-            print(f"  ✅ All UUIDs are unique ({len(unique_uuids)} total)")
+        if total_uuids == len(uuid_counts):
+            print(f"  ✅ All UUIDs are unique ({len(uuid_counts)} total)")
             return True
         else:
-            duplicate_count = len(all_uuids) - len(unique_uuids)
+            duplicate_count = total_uuids - len(uuid_counts)
             print(f"  ❌ Still have {duplicate_count} duplicate UUIDs")
 
             # Find remaining duplicates
-            uuid_counts = defaultdict(int)
-            for uuid in all_uuids:
-                uuid_counts[uuid] += 1
-
             duplicates = [uuid for uuid, count in uuid_counts.items() if count > 1]
             print(f"  Remaining duplicates: {duplicates}")
             return False
@@ -181,14 +209,12 @@ class XcodeProjectFixer:
         """Verify all object references have corresponding definitions"""
         print("\n🔍 Validating object references...")
 
-        # Extract all object definitions (UUID = {)
-        object_definitions = set(re.findall(r'([A-F0-9]{24}) = {', self.content))
-
-        # Extract all UUID references
-        all_references = set(re.findall(r'[A-F0-9]{24}', self.content))
+        # Object definitions (UUID = {) and references come from the same scan
+        scan = self.scan_project()
+        all_references = scan["uuid_counts"].keys()
 
         # Find orphaned references
-        orphaned = all_references - object_definitions
+        orphaned = all_references - scan["definitions"]
 
         if not orphaned:
             print(f"  ✅ All {len(all_references)} references have definitions")
@@ -210,10 +236,8 @@ class XcodeProjectFixer:
             'PBXSourcesBuildPhase'
         ]
 
-        missing_sections = []
-        for section in required_sections:
-            if f"/* Begin {section} section */" not in self.content:
-                missing_sections.append(section)
+        sections = self.scan_project()["sections"]
+        missing_sections = [section for section in required_sections if section not in sections]
 
         if not missing_sections:
             print(f"  ✅ All required sections present")
@@ -227,18 +251,20 @@ class XcodeProjectFixer:
         print("\n📄 Validating Xcode format...")
 
         # Check file header
-        if not self.content.startswith("// !$*UTF8*$!"):
+        if not self.content.startswith(b"// !$*UTF8*$!"):
             print("  ❌ Invalid project file header")
             return False
 
+        bracket_counts = self.scan_project()["bracket_counts"]
+
         # Check balanced braces
-        brace_count = self.content.count('{') - self.content.count('}')
+        brace_count = bracket_counts['{'] - bracket_counts['}']
         if brace_count != 0:
             print(f"  ❌ Unbalanced braces: {brace_count}")
             return False
 
         # Check balanced parentheses
-        paren_count = self.content.count('(') - self.content.count(')')
+        paren_count = bracket_counts['('] - bracket_counts[')']
         if paren_count != 0:
             print(f"  ❌ Unbalanced parentheses: {paren_count}")
             return False
@@ -246,91 +272,37 @@ class XcodeProjectFixer:
         print("  ✅ Xcode format is valid")
         return True
 
-    def save_project(self):
-        """Save fixed project with validation"""
-        print("\n💾 Saving fixed project...")
-
-        try:
-            # Write to temporary file first
-            temp_path = self.pbxproj_path.with_suffix('.pbxproj.tmp')
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(self.content)
-
-            # Replace original file
-            shutil.move(str(temp_path), str(self.pbxproj_path))
-            print(f"  ✅ Project saved successfully")
+    def _build_replacement_map(self):
+        if not self.detect_collisions():
+            print("✅ No UUID collisions detected. Project may already be fixed.")
+            return {}
+        return self.generate_replacement_uuids()
+
+    def _apply_edits(self, replacement_map):
+        # Both phases only collect UUID spans, so the content is rebuilt once
+        edits = self.fix_group_definitions() + self.fix_parent_references()
+        self.splice_content(edits)
+
+    def validate(self):
+        """Run every post-fix validation, stopping at the first failure"""
+        if not self.validate_uuid_uniqueness():
+            print("❌ UUID uniqueness validation failed")
+            return False
 
-            return True
-        except Exception as e:
-            print(f"  ❌ Failed to save project: {e}")
+        if not self.validate_object_references():
+            print("❌ Object reference validation failed")
             return False
 
-    def rollback(self):
-        """Rollback to original content"""
-        print("\n↩️  Rolling back to original content...")
-        self.content = self.original_content
-        if self.save_project():
-            print("  ✅ Rollback successful")
-        else:
-            print("  ❌ Rollback failed")
-
-    def fix_project(self):
-        """Main fix execution method"""
-        print("🚀 Starting StreamApp Xcode Project UUID Collision Fix")
-        print("=" * 60)
-
-        try:
-            # Phase 1: Load and analyze
-            self.load_project()
-            collisions = self.detect_collisions()
-
-            if not collisions:
-                print("✅ No UUID collisions detected. Project may already be fixed.")
-                return True
-
-            # Phase 2: Generate replacements
-            self.generate_replacement_uuids()
-
-            # Phase 3: Apply fixes
-            self.fix_group_definitions()
-            self.fix_parent_references()
-
-            # Phase 4: Validate
-            if not self.validate_uuid_uniqueness():
-                print("❌ UUID uniqueness validation failed")
-                self.rollback()
-                return False
-
-            if not self.validate_object_references():
-                print("❌ Object reference validation failed")
-                self.rollback()
-                return False
-
-            if not self.validate_project_structure():
-                print("❌ Project structure validation failed")
-                self.rollback()
-                return False
-
-            if not self.validate_xcode_format():
-                print("❌ Xcode format validation failed")
-                self.rollback()
-                return False
-
-            # Phase 5: Save
-            if not self.save_project():
-                print("❌ Failed to save project")
-                self.rollback()
-                return False
-
-            print("\n🎉 UUID collision fix completed successfully!")
-            print("✅ Project should now open correctly in Xcode")
-            return True
+        if not self.validate_project_structure():
+            print("❌ Project structure validation failed")
+            return False
 
-        except Exception as e:
-            print(f"\n💥 Critical error during fix: {e}")
-            self.rollback()
+        if not self.validate_xcode_format():
+            print("❌ Xcode format validation failed")
             return False
 
+        return True
+
 def main():
     project_path = "/Users/ashwathreddymuppa/Stream/ios/StreamApp.xcodeproj"
 
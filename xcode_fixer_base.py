@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the StreamApp Xcode project UUID collision fixers
+Loads project.pbxproj as bytes, generates replacement UUIDs and saves the
+result with a single atomic write once the subclass's checks pass
+"""
+
+import os
+import re
+import secrets
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+# Xcode object identifiers: 24 uppercase hex characters (96 bits)
+_UUID_RE = re.compile(rb'[A-F0-9]{24}')
+
+
+class BaseXcodeProjectFixer(ABC):
+    """Common load/generate/save flow; subclasses build and apply the edits"""
+
+    # Log wording; subclasses set title and may override the rest to keep
+    # their own output
+    success_lines = ()
+    banner_width = 60
+    save_failed_message = "❌ Failed to save project"
+    save_error_prefix = "❌ Failed to save project:"
+    error_prefix = "💥 Critical error during fix:"
+
+    def __init__(self, project_path):
+        self.project_path = Path(project_path)
+        self.pbxproj_path = self.project_path / "project.pbxproj"
+        self.content = b""
+
+    @property
+    def content(self):
+        return self._content
+
+    @content.setter
+    def content(self, value):
+        # Any reassignment invalidates scans cached against the old content
+        self._content = value
+        self._cache = {}
+
+    def existing_uuids(self):
+        """Return the set of UUIDs in the current content (cached per revision)"""
+        if "uuids" not in self._cache:
+            self._cache["uuids"] = {uuid.decode('ascii') for uuid in _UUID_RE.findall(self.content)}
+        return self._cache["uuids"]
+
+    def splice_content(self, edits):
+        """Apply non-overlapping (start, end, replacement) edits in one rebuild"""
+        # Copy each unchanged run once into a single buffer instead of
+        # allocating a full new bytes object per replacement
+        view = memoryview(self.content)
+        out = bytearray()
+        position = 0
+        for start, end, replacement in sorted(edits):
+            out += view[position:start]
+            out += replacement
+            position = end
+        out += view[position:]
+        self.content = bytes(out)
+
+    def generate_xcode_uuid(self):
+        """Generate proper Xcode-compatible 24-character hex UUID"""
+        return secrets.token_bytes(12).hex().upper()
+
+    def generate_unique_uuids(self, count, existing_uuids=frozenset()):
+        """Generate a list of count UUIDs unique among themselves and existing_uuids"""
+        # Draw the whole batch from the OS RNG at once; with 96 random bits per
+        # UUID the redraw loop below practically never runs
+        batch = secrets.token_bytes(12 * count).hex().upper()
+        uuids = []
+        seen = set(existing_uuids)
+        for i in range(0, len(batch), 24):
+            uuid = batch[i:i + 24]
+            while uuid in seen:
+                uuid = self.generate_xcode_uuid()
+            seen.add(uuid)
+            uuids.append(uuid)
+        return uuids
+
+    def load_project(self):
+        """Load project file"""
+        print(f"Loading project file: {self.pbxproj_path}")
+        try:
+            # Everything we touch is ASCII, so work on the raw bytes and skip
+            # the UTF-8 decode/encode round-trip entirely
+            with open(self.pbxproj_path, 'rb') as f:
+                self.content = f.read()
+            print(f"✅ Project file loaded ({len(self.content)} bytes)")
+        except Exception as e:
+            raise Exception(f"Failed to load project file: {e}")
+
+    def save_project(self):
+        """Save fixed project with a single atomic write"""
+        print("\n💾 Saving fixed project...")
+
+        try:
+            # Write to temporary file first and flush it all the way to disk
+            temp_path = self.pbxproj_path.with_suffix('.pbxproj.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(self.content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Atomically replace original file (temp file is on the same filesystem)
+            os.replace(temp_path, self.pbxproj_path)
+            print("  ✅ Project saved successfully")
+            return True
+        except Exception as e:
+            print(f"  {self.save_error_prefix} {e}")
+            return False
+
+    @abstractmethod
+    def _build_replacement_map(self):
+        """Return the replacement map keyed by old UUID; empty means nothing to fix"""
+
+    @abstractmethod
+    def _apply_edits(self, replacement_map):
+        """Rewrite self.content according to the replacement map"""
+
+    def validate(self):
+        """Check the edited content before it is written"""
+        return True
+
+    def fix_project(self):
+        """Main fix execution method"""
+        print(f"🚀 Starting {self.title}")
+        print("=" * self.banner_width)
+
+        try:
+            self.load_project()
+
+            replacement_map = self._build_replacement_map()
+            if not replacement_map:
+                return True
+
+            self._apply_edits(replacement_map)
+
+            # Edits only live in memory until they validate, so any failure
+            # before the save leaves the project file on disk untouched
+            if not self.validate():
+                return False
+
+            if not self.save_project():
+                print(self.save_failed_message)
+                return False
+
+            for line in self.success_lines:
+                print(line)
+            return True
+
+        except Exception as e:
+            print(f"\n{self.error_prefix} {e}")
+            return False